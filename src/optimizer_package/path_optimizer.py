@@ -10,9 +10,136 @@ Modelling Multi Rotor Drone Path and Energy Consumption
 
 import math
 import numpy as np
-import bezier
 from scipy.optimize import minimize
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional, the kernels below also run as plain NumPy
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+BATTERY_SAFETY_FACTOR = 0.80  # Use only 80% of battery
+
+
+def bernstein_basis(num_points, degree=3):
+    """
+    Bernstein basis of a Bezier curve sampled at num_points evenly spaced s in [0, 1]
+
+    Returns:
+    (num_points, degree + 1) array B, so that B @ control_points gives the curve points
+    """
+    s = np.linspace(0, 1, num_points)[:, None]
+    k = np.arange(degree + 1)
+    coeffs = np.array([math.comb(degree, i) for i in k], dtype=float)
+    return coeffs * s**k * (1 - s)**(degree - k)
+
+
+@njit(cache=True, fastmath=True)
+def _power_required_core(vels, v_wind, W, half_rho_CD0_S, inv_2rhoA, profile_coef, inv_eff):
+    """
+    Electrical power (W) for (N, 3) ground-frame velocities flown through (N, 3) wind vectors
+
+    The remaining arguments are the loop invariant constants precomputed by PathOptimizer.
+    """
+
+    # Airspeed components (ground speed - wind)
+    v_air_x = vels[:, 0] - v_wind[:, 0]
+    v_air_y = vels[:, 1] - v_wind[:, 1]
+    v_air_z = vels[:, 2] - v_wind[:, 2]
+
+    v_h_sq = v_air_x * v_air_x + v_air_y * v_air_y  # horizontal airspeed squared
+
+    # Thrust required
+    D = half_rho_CD0_S * v_h_sq
+    T = np.sqrt(W * W + D * D)  # When flying forward, drone tilts to overcome drag
+
+    # Induced power in hover
+    v_i = np.sqrt(T * inv_2rhoA)  # induced velocity in hover
+    v_i_eps = v_i + 1e-6  # avoid div by zero
+    mu_sq = v_h_sq / (v_i_eps * v_i_eps)  # advance ratio squared
+    P_induced = T * v_i / np.sqrt(1 + mu_sq)
+
+    # Pofile power (blade drag)
+    P_profile = profile_coef * v_i
+
+    # Parasitic power (body drag), the only term needing the horizontal airspeed itself
+    P_parasitic = D * np.sqrt(v_h_sq)
+
+    # Climb power (if climbing) aka potential energy rate, branchless max(v_air_z, 0)
+    P_climb = 0.5 * W * (v_air_z + np.abs(v_air_z))
+
+    # mechaical power before efficiencies
+    P_mechanical = P_induced + P_profile + P_parasitic + P_climb
+
+    # Account for rotor efficiency (figure of merit) and motor efficiency
+    P_electrical = P_mechanical * inv_eff
+
+    # Ensure non-negative
+    return np.maximum(P_electrical, 0.0)  # Watts from battery
+
+
+def segment_geometry(path_points, deltas=None, dists=None):
+    """
+    Segment vectors and lengths between consecutive points of (..., N, 3) sampled paths,
+    written into the preallocated deltas / dists arrays when given
+
+    Returns:
+    deltas (..., N - 1, 3), dists (..., N - 1)
+    """
+    deltas = np.subtract(path_points[..., 1:, :], path_points[..., :-1, :], out=deltas)
+    dists = np.einsum('...ij,...ij->...i', deltas, deltas, out=dists)  # row norms without a squared temporary
+    np.sqrt(dists, out=dists)
+    return deltas, dists
+
+
+@njit(cache=True, fastmath=True)
+def _compute_path_core(deltas, dists, v_start, v_end, v_wind, params):
+    """
+    Integrate energy and time along the N - 1 segments of a sampled path
+
+    deltas and dists come from segment_geometry, v_wind holds the wind at the start of
+    each segment and params the power model constants in _power_required_core order.
+
+    Returns:
+    E_total_J, time_total, max_power
+    """
+    n_segments = dists.shape[0]
+
+    # local speed interpolation, s in [0,1] across segments
+    s = np.arange(n_segments) / max(n_segments - 1, 1)
+    speeds = np.maximum(1e-3, v_start + (v_end - v_start) * s)  # guard speed
+
+    dts = dists / speeds  # time for each segment
+
+    # velocity components (ground-frame)
+    vels = deltas / dts.reshape((n_segments, 1))
+
+    W, half_rho_CD0_S, inv_2rhoA, profile_coef, inv_eff = params
+    powers = _power_required_core(vels, v_wind, W, half_rho_CD0_S, inv_2rhoA, profile_coef, inv_eff)
+
+    return (powers * dts).sum(), dts.sum(), powers.max()
+
+
+@njit(cache=True, fastmath=True)
+def _compute_paths_core(deltas, dists, v_start, v_end, v_wind, params):
+    """
+    _compute_path_core over a stack of K paths in a single compiled call
+
+    Returns:
+    (3, K) array of E_total_J, time_total and max_power rows
+    """
+    K = dists.shape[0]
+    out = np.empty((3, K))
+    for k in range(K):
+        E_total_J, time_total, max_power = _compute_path_core(deltas[k], dists[k], v_start[k], v_end[k],
+                                                            v_wind[k], params)
+        out[0, k] = E_total_J
+        out[1, k] = time_total
+        out[2, k] = max_power
+    return out
+
+
 class PathOptimizer:
 
     def __init__(self, rho, S, CD0, mass, battery_capacity_Wh, motor_power_limit_W
@@ -49,8 +176,42 @@ class PathOptimizer:
         self.max_time = max_time  # max mission time in seconds
         self.num_points = num_points  # number of path segments for integration
 
+        # Power model loop invariants, hoisted out of the per-segment kernel
+        self._W = self.mass * self.g
+        self._half_rho_CD0_S = 0.5 * self.rho * self.CD0 * self.S
+        self._inv_2rhoA = 1.0 / (2 * self.rho * self.area_rotors)
+        self._inv_eff = 1.0 / (self.figure_of_merit * self.motor_efficiency)
+        self._profile_coef = 0.15 * self._W
+
+        # Cubic Bernstein basis on the fixed sampling grid, reused by every compute_path call
+        self._bezier_B = bernstein_basis(self.num_points, degree=3)
+
+        # Work buffers for the batched gradient evaluation of x plus one step per variable (8 + 1 paths)
+        n_batch = 9
+        self._buf_control_points = np.empty((n_batch, 4, 3))
+        self._buf_paths = np.empty((n_batch, self.num_points, 3))
+        self._buf_deltas = np.empty((n_batch, self.num_points - 1, 3))
+        self._buf_dists = np.empty((n_batch, self.num_points - 1))
+
         self.max_power_encountered = 0  # track max power during path
 
+        # compute_path result for the last x, SLSQP evaluates the objective and every constraint at the same x
+        self._last_x_bytes = None
+        self._last_result = None
+
+        # path_jacobian result for the last x, and the upper bounds its finite difference steps respect
+        self._last_jac_x_bytes = None
+        self._last_jac = None
+        self._upper_bounds = None
+
+        # Segment start / end points and cached evaluations of the multi segment solve (optimize_multi_segment)
+        self._segment_starts = None
+        self._segment_ends = None
+        self._last_all_x_bytes = None
+        self._last_all_result = None
+        self._last_all_jac_x_bytes = None
+        self._last_all_jac = None
+
         self.VERBOSE = VERBOSE
 
     def power_required(self, v_x, v_y, v_z, position):
@@ -63,57 +224,60 @@ class PathOptimizer:
         Returns:
         Power in Watts (electrical power from battery)
         """
+        vels = np.array([[v_x, v_y, v_z]], dtype=float)
+        positions = np.array([position], dtype=float)
+        return float(self.power_required_vec(vels, positions)[0])  # Watts from battery
 
-        # Airspeed components (ground speed - wind)
-        v_wind = self.wind_field.get_wind_at_point(position) # Find wind at current position
-        v_air_x = v_x - v_wind[0]
-        v_air_y = v_y - v_wind[1]
-        v_air_z = v_z - v_wind[2]
-
-        v_h = math.sqrt(v_air_x**2 + v_air_y**2)  # horizontal airspeed
-
-        # Thrust required
-        W = self.mass * self.g
-        D = 0.5 * self.rho * v_h**2 * self.CD0 * self.S
-        T = math.sqrt(W**2 + D**2) # When flying forward, drone tilts to overcome drag
-
-        # Induced power in hover
-        v_i = math.sqrt(T / (2 * self.rho * self.area_rotors))  # induced velocity in hover    
-        mu = v_h / (v_i + 1e-6) # avoid div by zero (advance ratio)
-        P_induced = T * v_i / math.sqrt(1 + mu**2)
+    def power_required_vec(self, vels, positions):
+        """
+        Compute power required for a batch of segments
 
-        # Pofile power (blade drag)
-        P_profile = 0.15 * W * v_i
+        Parameters:
+        vels: (N, 3) array of velocity components in m/s (ground frame)
+        positions: (N, 3) array of positions the velocities are evaluated at
 
-        # Parasitic power (body drag)
-        P_parasitic = D * v_h
+        Returns:
+        (N,) array of power in Watts (electrical power from battery)
+        """
 
-        # Climb power (if climbing) aka potential energy rate
-        P_climb = W * v_air_z if v_air_z > 0 else 0
+        v_wind = self.wind_at_points(positions)  # Find wind at every position
+        vels = np.ascontiguousarray(vels, dtype=float)
+        return _power_required_core(vels, v_wind, *self.power_params())
 
-        # mechaical power before efficiencies
-        P_mechanical = P_induced + P_profile + P_parasitic + P_climb
+    def power_params(self):
+        """
+        Power model constants, in the argument order of the compiled power kernel
+        """
+        return (float(self._W), float(self._half_rho_CD0_S), float(self._inv_2rhoA),
+                float(self._profile_coef), float(self._inv_eff))
 
-        # Account for rotor efficiency (figure of merit)
-        P_mechanical = P_mechanical / self.figure_of_merit
+    def wind_at_points(self, positions):
+        """
+        Wind vectors at a batch of positions
 
-        # Account for motor efficiency
-        P_electrical = P_mechanical / self.motor_efficiency
+        Parameters:
+        positions: (N, 3) array of positions (x, y, z)
 
-        # Ensure non-negative
-        P_electrical = max(P_electrical, 0)
+        Uses the wind field's get_wind_at_points batch API when it has one, and falls
+        back to one get_wind_at_point call per position otherwise.
 
-        return P_electrical  # Watts from battery
+        Returns:
+        (N, 3) array of wind components in m/s
+        """
+        get_wind_at_points = getattr(self.wind_field, 'get_wind_at_points', None)
+        if get_wind_at_points is not None:
+            return np.ascontiguousarray(get_wind_at_points(positions), dtype=float)
+        return np.array([self.wind_field.get_wind_at_point(p) for p in positions], dtype=float)
     
     def bezier_curve(self, control_points, num_points=30):
         """
         Generate Bezier curve points from control points
         """
-        nodes = np.asfortranarray(control_points).T
-        curve = bezier.Curve(nodes, degree=len(control_points) - 1)
-        s_vals = np.linspace(0, 1, num_points)
-        points = curve.evaluate_multi(s_vals).T
-        return points
+        P = np.asarray(control_points, dtype=float)  # (degree + 1, 3)
+        if len(P) == 4 and num_points == self.num_points:
+            return self._bezier_B @ P
+        B = bernstein_basis(num_points, degree=len(P) - 1)
+        return B @ P
     
     def compute_path(self, x):
         """
@@ -124,9 +288,28 @@ class PathOptimizer:
         path_points: sampled points along the path
         """
 
-        E_total_J = 0.0
-        time_total = 0.0
-        self.max_power_encountered = 0.0  # reset for this computation
+        x = np.asarray(x, dtype=float)
+        x_bytes = x.tobytes()
+        if x_bytes == self._last_x_bytes:
+            E_total_J, time_total, path_points, self.max_power_encountered = self._last_result
+            return E_total_J, time_total, path_points
+
+        E_total_J, time_total, max_power, path_points = self.evaluate_path(x)
+
+        # Track maximum power for power constraint
+        self.max_power_encountered = max_power
+
+        self._last_x_bytes = x_bytes
+        self._last_result = (E_total_J, time_total, path_points, self.max_power_encountered)
+
+        return E_total_J, time_total, path_points
+
+    def evaluate_path(self, x, start_point=None, end_point=None):
+        """
+        Uncached path evaluation behind compute_path, start_point / end_point default to the mission's
+        Returns:
+        E_total_J, time_total, max_power, path_points
+        """
 
         # Two speeds: start and end (linear interpolation along path)
         v_start = x[0]
@@ -135,60 +318,107 @@ class PathOptimizer:
         # Bezier curve control points are now at indices 2..8
         point1 = (x[2], x[3], x[4])
         point2 = (x[5], x[6], x[7])
-        control_points = [self.start_point, point1, point2, self.end_point]
+        if start_point is None:
+            start_point = self.start_point
+        if end_point is None:
+            end_point = self.end_point
+        control_points = [start_point, point1, point2, end_point]
         
-        # Sample the points along the Bezier curve
+        # Sample the points along the Bezier curve, (N, 3) array
         path_points = self.bezier_curve(control_points, num_points=self.num_points)
 
-        N = len(path_points)
-        for i in range(N - 1):
-            p0 = path_points[i]
-            p1 = path_points[i + 1]
+        # Wind at the start of every segment, evaluated once outside the compiled kernel
+        v_wind = self.wind_at_points(path_points[:-1])
 
-            # Distance between points
-            dist = math.sqrt((p1[0] - p0[0])**2 + (p1[1] - p0[1])**2 + (p1[2] - p0[2])**2)
-            # local speed interpolation (use segment midpoint index for better mapping)
-            s = i / max(N - 2, 1)   # s in [0,1] across segments
-            speed_local = v_start + (v_end - v_start) * s
-            # guard speed
-            speed_local = max(1e-3, speed_local)
+        deltas, dists = segment_geometry(path_points)
+        E_total_J, time_total, max_power = _compute_path_core(
+            deltas, dists, float(v_start), float(v_end), v_wind, self.power_params()
+        )
 
-            dt = dist / speed_local  # time for this segment
+        return float(E_total_J), float(time_total), float(max_power), path_points
 
-            # velocity components (ground-frame)
-            v_x = (p1[0] - p0[0]) / dt
-            v_y = (p1[1] - p0[1]) / dt
-            v_z = (p1[2] - p0[2]) / dt
+    def evaluate_paths(self, X, start_points=None, end_points=None):
+        """
+        Batched evaluate_path for a (K, len(x)) stack of optimization variables
+        start_points / end_points: one (3,) point for every path or a (K, 3) row per path,
+        default to the mission's
+        Returns:
+        (3, K) array of E_total_J, time_total and max_power rows
+        """
 
-            # Get power
-            power = self.power_required(v_x, v_y, v_z, p0)
+        K = len(X)
+        N = self.num_points
 
-            # Track maximum power for power constraint
-            self.max_power_encountered = max(self.max_power_encountered, power)
+        # Reuse the preallocated work buffers when the batch has their shape (the gradient case),
+        # nothing written to them is returned to the caller
+        if K == len(self._buf_paths):
+            control_points, paths = self._buf_control_points, self._buf_paths
+            deltas, dists = self._buf_deltas, self._buf_dists
+        else:
+            control_points, paths = np.empty((K, 4, 3)), np.empty((K, N, 3))
+            deltas, dists = np.empty((K, N - 1, 3)), np.empty((K, N - 1))
 
-            # Add to total energy
-            E_segment_J = power * dt
-            E_total_J += E_segment_J
+        control_points[:, 0] = self.start_point if start_points is None else start_points
+        control_points[:, 1] = X[:, 2:5]
+        control_points[:, 2] = X[:, 5:8]
+        control_points[:, 3] = self.end_point if end_points is None else end_points
 
-            # Add to total time
-            time_total += dt
+        # Sample every Bezier curve at once, (K, N, 3)
+        np.matmul(self._bezier_B, control_points, out=paths)
+
+        # One wind lookup for the start points of every segment of every path
+        v_wind = self.wind_at_points(paths[:, :-1].reshape(-1, 3)).reshape(K, N - 1, 3)
+
+        segment_geometry(paths, deltas, dists)
+        return _compute_paths_core(deltas, dists, np.ascontiguousarray(X[:, 0]), np.ascontiguousarray(X[:, 1]),
+                                   v_wind, self.power_params())
+
+    def path_jacobian(self, x):
+        """
+        Gradients of energy, time and max power with respect to x, shape (3, len(x))
+
+        One forward difference per variable shared by the objective and all constraints,
+        instead of SLSQP differencing each of the four functions separately. Steps flip
+        backwards where a forward step would leave the optimization bounds, and x plus
+        all of its steps go through evaluate_paths together.
+        """
+
+        x = np.asarray(x, dtype=float)
+        x_bytes = x.tobytes()
+        if x_bytes == self._last_jac_x_bytes:
+            return self._last_jac
+
+        h = np.sqrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(x))
+        if self._upper_bounds is not None:
+            h = np.where(x + h > self._upper_bounds, -h, h)
+
+        # Evaluate x and all of its steps in one batched pass
+        X = np.tile(x, (len(x) + 1, 1))
+        X[1:] += np.diag(h)
+        f = self.evaluate_paths(X)
+
+        jac = (f[:, 1:] - f[:, :1]) / h
+
+        self._last_jac_x_bytes = x_bytes
+        self._last_jac = jac
+        return jac
 
-        return E_total_J, time_total, path_points
-    
     def objective_function(self, x):
         # Objective: minimize energy consumption (return e)
         e, t, _ = self.compute_path(x)
         return e
         
+    def objective_jac(self, x):
+        return self.path_jacobian(x)[0]
+
     def constraint_battery(self, x):
         E_total_J, _, _ = self.compute_path(x)
         E_total_Wh = E_total_J / 3600
-        safety_factor = 0.80  # Use only 80% of battery
-        return (self.battery_capacity_Wh * safety_factor) - E_total_Wh
+        return (self.battery_capacity_Wh * BATTERY_SAFETY_FACTOR) - E_total_Wh
 
     def constraint_motor_power(self, x):
-        # Limit instantaneous motor power
-        _, _, _ = self.compute_path(x)
+        # Limit instantaneous motor power, compute_path (cached per x) sets max_power_encountered
+        self.compute_path(x)
         return self.motor_power_limit_W - self.max_power_encountered 
 
     def constraint_time(self, x):
@@ -196,51 +426,177 @@ class PathOptimizer:
         _, time, _ = self.compute_path(x)
         return self.max_time - time
 
-    def optimize_mission(self):
-        # Initial guess 
+    def constraints_all(self, x):
+        # Battery, motor power and time margins as one vector, so SLSQP makes a single Python call per x
+        # and all three margins come from one (cached) compute_path lookup
+        E_total_J, time, _ = self.compute_path(x)
+        return np.array([
+            (self.battery_capacity_Wh * BATTERY_SAFETY_FACTOR) - E_total_J / 3600,
+            self.motor_power_limit_W - self.max_power_encountered,
+            self.max_time - time
+        ])
+
+    def constraints_all_jac(self, x):
+        dE, dT, dP = self.path_jacobian(x)
+        return np.stack([-dE / 3600, -dP, -dT])
+
+    def compute_path_all(self, x):
+        """
+        Multi segment counterpart of compute_path, x concatenates the 8 variables of every
+        segment set up by optimize_multi_segment
+        Returns:
+        E_total_J: energy summed over all segments in Joules
+        time_total: time summed over all segments in seconds
+        max_power: max power over all segments
+        segment_values: (3, n_segments) array of per segment energy, time and max power
+        """
+
+        x = np.asarray(x, dtype=float)
+        x_bytes = x.tobytes()
+        if x_bytes == self._last_all_x_bytes:
+            return self._last_all_result
+
+        # Every segment evaluated in one batched pass, a row of 8 variables per segment
+        segment_values = self.evaluate_paths(x.reshape(-1, 8), self._segment_starts, self._segment_ends)
+        E_segments, time_segments, power_segments = segment_values
+        result = (float(E_segments.sum()), float(time_segments.sum()), float(power_segments.max()), segment_values)
+
+        self._last_all_x_bytes = x_bytes
+        self._last_all_result = result
+        return result
+
+    def path_all_jacobian(self, x):
+        """
+        Gradients of total energy, total time and max power with respect to the multi segment x,
+        shape (3, len(x))
+
+        A segment's energy and time only depend on its own 8 variables, so the gradient is built
+        from per segment forward difference blocks, all segments and steps in one evaluate_paths
+        call. Max power takes the gradient of the segment that attains it.
+        """
+
+        x = np.asarray(x, dtype=float)
+        x_bytes = x.tobytes()
+        if x_bytes == self._last_all_jac_x_bytes:
+            return self._last_all_jac
+
+        n_segments = len(x) // 8
+        h = np.sqrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(x))
+        if self._upper_bounds is not None:
+            h = np.where(x + h > self._upper_bounds, -h, h)
+        h = h.reshape(n_segments, 8)
+
+        # (n_segments, 9, 8): each segment's x followed by one step per variable
+        X = np.repeat(x.reshape(n_segments, 1, 8), 9, axis=1)
+        X[:, 1:] += h[:, None, :] * np.eye(8)
+        f = self.evaluate_paths(X.reshape(-1, 8), np.repeat(self._segment_starts, 9, axis=0),
+                                np.repeat(self._segment_ends, 9, axis=0)).reshape(3, n_segments, 9)
+
+        blocks = (f[:, :, 1:] - f[:, :, :1]) / h  # (3, n_segments, 8)
+
+        jac = np.zeros((3, len(x)))
+        jac[0] = blocks[0].ravel()
+        jac[1] = blocks[1].ravel()
+        k = np.argmax(f[2, :, 0])
+        jac[2, 8 * k:8 * (k + 1)] = blocks[2, k]
+
+        self._last_all_jac_x_bytes = x_bytes
+        self._last_all_jac = jac
+        return jac
+
+    def objective_all(self, x):
+        return self.compute_path_all(x)[0]
+
+    def objective_all_jac(self, x):
+        return self.path_all_jacobian(x)[0]
+
+    def constraints_multi_segment(self, x):
+        # Battery, motor power and time margins of the whole mission
+        E_total_J, time_total, max_power, _ = self.compute_path_all(x)
+        return np.array([
+            (self.battery_capacity_Wh * BATTERY_SAFETY_FACTOR) - E_total_J / 3600,
+            self.motor_power_limit_W - max_power,
+            self.max_time - time_total
+        ])
+
+    def constraints_multi_segment_jac(self, x):
+        dE, dT, dP = self.path_all_jacobian(x)
+        return np.stack([-dE / 3600, -dP, -dT])
+
+    def set_wind(self, wind_field):
+        """
+        Swap in a new wind field so one optimizer (and its precomputed state) can be reused
+        across a sweep. Clears the cached path and gradient evaluations of the old wind.
+        """
+        self.wind_field = wind_field
+        self._clear_caches()
+
+    def _clear_caches(self):
+        # Drop every cached path and gradient evaluation
+        self._last_x_bytes = None
+        self._last_result = None
+        self._last_jac_x_bytes = None
+        self._last_jac = None
+        self._last_all_x_bytes = None
+        self._last_all_result = None
+        self._last_all_jac_x_bytes = None
+        self._last_all_jac = None
+
+    def initial_guess(self, start_point, end_point):
         # [speed_start, speed_end, point1_x, point1_y, point1_z, point2_x, point2_y, point2_z]
         x0 = [15.0, 15.0]
-        
+
         # Add control points (2 points in 3D), and interpolate initial guesses
         for point in range(2):  # 2 points
             for i in range(2):  # x, y
-                coord = self.start_point[i] + (self.end_point[i] - self.start_point[i]) * (point + 1) / 3
+                coord = start_point[i] + (end_point[i] - start_point[i]) * (point + 1) / 3
                 x0.append(coord) 
-            x0.append(max(self.start_point[2], self.end_point[2]) + 20)  # z initial guess
+            x0.append(max(start_point[2], end_point[2]) + 20)  # z initial guess
+        return x0
 
-        # Bounds
+    def segment_bounds(self, start_point, end_point):
+        # Bounds on the 8 variables of the segment from start_point to end_point
+        z_min = min(start_point[2], end_point[2])
+        z_max = max(start_point[2], end_point[2])
 
-        z_start = self.start_point[2]
-        z_end = self.end_point[2]
-        z_min = min(z_start, z_end)
-        z_max = max(z_start, z_end)
-        
-        bounds = [
+        return [
             (15.0, 30.0),  # speed bound start
             (15.0, 30.0),  # speed bound end
 
             # control point 1 (allow some deviation, 50m)
-            (min(self.start_point[0], self.end_point[0]) - 40, max(self.start_point[0], self.end_point[0]) + 40),  # x1
-            (min(self.start_point[1], self.end_point[1]) - 40, max(self.start_point[1], self.end_point[1]) + 40),  # y1
+            (min(start_point[0], end_point[0]) - 40, max(start_point[0], end_point[0]) + 40),  # x1
+            (min(start_point[1], end_point[1]) - 40, max(start_point[1], end_point[1]) + 40),  # y1
             (max(0, z_min - 40), z_max + 40),  # z1
 
             # control point 2 (allow some deviation, 50m)
-            (min(self.start_point[0], self.end_point[0]) - 40, max(self.start_point[0], self.end_point[0]) + 40),  # x2
-            (min(self.start_point[1], self.end_point[1]) - 40, max(self.start_point[1], self.end_point[1]) + 40),  # y2 
+            (min(start_point[0], end_point[0]) - 40, max(start_point[0], end_point[0]) + 40),  # x2
+            (min(start_point[1], end_point[1]) - 40, max(start_point[1], end_point[1]) + 40),  # y2 
             (max(0, z_min - 40), z_max + 40),  # z2
         ]
+
+    def optimize_mission(self, x0=None, method='SLSQP', tol=1e-4, maxiter=200):
+        # Initial guess, x0 warm starts from a previous solution (e.g. result.x of a similar mission)
+        # method / tol / maxiter are forwarded to scipy.optimize.minimize, only the constrained methods
+        # (SLSQP, trust-constr, COBYLA) enforce the battery / power / time constraints
+        if x0 is None:
+            x0 = self.initial_guess(self.start_point, self.end_point)
+
+        # Bounds
+        bounds = self.segment_bounds(self.start_point, self.end_point)
         
-        # Constraints
+        # Constraints, battery / motor power / time fused into one vector-valued constraint
         constraints = [
-            {'type': 'ineq', 'fun': self.constraint_battery},
-            {'type': 'ineq', 'fun': self.constraint_motor_power},
-            {'type': 'ineq', 'fun': self.constraint_time}
+            {'type': 'ineq', 'fun': self.constraints_all, 'jac': self.constraints_all_jac}
         ]
 
-        options = {'disp': False, 'maxiter': 500}
+        options = {'disp': False, 'maxiter': maxiter}
 
-        # Run optimization
-        result = minimize(self.objective_function, x0, constraints=constraints, bounds=bounds, method='SLSQP', options=options)
+        # Run optimization, starting from empty compute_path and path_jacobian caches
+        self._clear_caches()
+        self._upper_bounds = np.array([ub for _, ub in bounds])
+        x0 = np.asarray(x0, dtype=float)
+        result = minimize(self.objective_function, x0, jac=self.objective_jac, constraints=constraints,
+                          bounds=bounds, method=method, tol=tol, options=options)
 
         if result.success is False:
             print("Optimization failed:", result.message)
@@ -276,3 +632,66 @@ class PathOptimizer:
 
             return result, time, total_E_Wh, path_points
         return None, None, None, None
+
+    def optimize_multi_segment(self, points, x0=None, method='SLSQP', tol=1e-4, maxiter=200):
+        """
+        Optimize a mission through all waypoints in one solve, instead of one optimize_mission
+        per segment. Energy is minimized over the whole mission, and the battery, motor power and
+        time (max_time) constraints apply to the mission as a whole.
+        Parameters:
+        points: waypoints (W, 3), giving W - 1 segments
+        x0: optional initial guess, the 8 variables of every segment concatenated
+        method / tol / maxiter: forwarded to scipy.optimize.minimize as in optimize_mission
+        Returns:
+        result: scipy result, result.x holds the 8 variables of every segment
+        times: time (s) of every segment
+        energies_Wh: energy (Wh) of every segment
+        path_points: (num_points, 3) sampled path of every segment
+        """
+
+        points = np.asarray(points, dtype=float)
+        self._segment_starts = points[:-1]
+        self._segment_ends = points[1:]
+        n_segments = len(points) - 1
+
+        if x0 is None:
+            x0 = sum((self.initial_guess(start, end) for start, end in zip(points[:-1], points[1:])), [])
+
+        bounds = []
+        for start, end in zip(points[:-1], points[1:]):
+            bounds.extend(self.segment_bounds(start, end))
+
+        constraints = [
+            {'type': 'ineq', 'fun': self.constraints_multi_segment, 'jac': self.constraints_multi_segment_jac}
+        ]
+
+        options = {'disp': False, 'maxiter': maxiter}
+
+        self._clear_caches()
+        self._upper_bounds = np.array([ub for _, ub in bounds])
+        x0 = np.asarray(x0, dtype=float)
+        result = minimize(self.objective_all, x0, jac=self.objective_all_jac, constraints=constraints,
+                          bounds=bounds, method=method, tol=tol, options=options)
+
+        if result.success is False:
+            print("Optimization failed:", result.message)
+            return None, None, None, None
+
+        # Per segment diagnostics from the single solution
+        times, energies_Wh, path_points = [], [], []
+        for i in range(n_segments):
+            e_J, time, _, segment_path = self.evaluate_path(result.x[8 * i:8 * (i + 1)], points[i], points[i + 1])
+            times.append(time)
+            energies_Wh.append(e_J / 3600)
+            path_points.append(segment_path)
+
+        if self.VERBOSE:
+            print("\n" + "="*50)
+            print("MULTI SEGMENT OPTIMIZATION RESULTS")
+            print("="*50)
+            print(f"Segments:        {n_segments}")
+            print(f"Total Time:      {sum(times):.2f} s")
+            print(f"Total Energy:    {sum(energies_Wh):.2f} Wh")
+            print(f"Battery Used:    {(sum(energies_Wh)/self.battery_capacity_Wh)*100:.1f}%")
+
+        return result, times, energies_Wh, path_points
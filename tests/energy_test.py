@@ -6,9 +6,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import matplotlib.pyplot as plt
 import csv
+import multiprocessing as mp
+import os
 
 from src.optimizer_package.path_optimizer import PathOptimizer
-from tests.wind import Wind
+from tests.wind import make_wind, DEFAULT_WIND
+
+# output directories, so a fresh checkout does not fail at the first savefig or csv write
+Path('artifacts/plots').mkdir(parents=True, exist_ok=True)
+Path('artifacts/reports').mkdir(parents=True, exist_ok=True)
 
 
 def multiple_path_plot(paths, wind_speeds, title="Multiple Drone Flight Paths"):
@@ -16,9 +22,7 @@ def multiple_path_plot(paths, wind_speeds, title="Multiple Drone Flight Paths"):
     ax = fig.add_subplot(111, projection='3d')
 
     for idx, path_points in enumerate(paths):
-        xs = [p[0] for p in path_points]
-        ys = [p[1] for p in path_points]
-        zs = [p[2] for p in path_points]
+        xs, ys, zs = path_points[:, 0], path_points[:, 1], path_points[:, 2]  # (N, 3) ndarray columns
 
         ax.plot(xs, ys, zs, marker='o', label=f'Wind {wind_speeds[idx]} m/s')
 
@@ -30,10 +34,44 @@ def multiple_path_plot(paths, wind_speeds, title="Multiple Drone Flight Paths"):
 
     plt.savefig(f'artifacts/plots/{title}.png', dpi=300, bbox_inches='tight')
 
-def compare_tailwind_tests(z_c, wind_range):
+def run_windspeeds(z_c, direction, windspeeds):
+    """Run simple_test for consecutive windspeeds, warm starting each from the previous optimum"""
+    outputs = []
+    x0 = None  # first windspeed starts from the default initial guess
+    # Set wind baselines
+    winds = [make_wind(z_c, direction, windspeed) for windspeed in windspeeds]
+    optimizer = build_optimizer(winds[0])  # reused for every windspeed
+
+    for windspeed, wind_field in zip(windspeeds, winds):
+        print(f"\nTesting windspeed: {windspeed} m/s")
+
+        # warm start from the previous windspeed's optimum, the geometry is the same
+        output = simple_test(wind_field=wind_field, x0=x0, optimizer=optimizer)
+        x0 = output[-1]
+        outputs.append(output)
+
+        print("-"*40)
+
+    return outputs
+
+def sweep_directions(z_c, directions, windspeeds):
+    """
+    Run the full windspeed sweep for each wind direction, one worker process per direction.
+    Windspeeds stay in order inside a sweep so every solve after the first is warm started.
+    Returns one list of simple_test outputs per direction.
+    """
+    jobs = [(z_c, direction, windspeeds) for direction in directions]
+    processes = min(os.cpu_count() or 1, len(jobs))
+
+    if processes > 1:
+        with mp.Pool(processes) as pool:
+            return pool.starmap(run_windspeeds, jobs)
+    return [run_windspeeds(*job) for job in jobs]
+
+def compare_tailwind_tests(z_c, wind_range, outputs=None):
     """Compare PathOptimizer vs StraightLineMission across different windspeeds"""
     
-    windspeeds = wind_range
+    windspeeds = list(wind_range)
     # path points storage
     paths = []
     
@@ -49,14 +87,12 @@ def compare_tailwind_tests(z_c, wind_range):
     print("Running tests...")
     print("="*60)
     
-    # Loop over different tailwind speeds
-    for windspeed in windspeeds:
-        print(f"\nTesting windspeed: {windspeed} m/s")
+    if outputs is None:
+        outputs = run_windspeeds(z_c, 0, windspeeds)  # tailwind
 
-        # Set wind baseline
-        wind_field = Wind(z_c, 0, windspeed)  # tailwind
-        
-        straight_energy_x, straight_time_x, optimizer_energy_x, optimizer_time_x, path_points, start_speed, end_speed = simple_test(wind_field=wind_field)
+    # Loop over different tailwind speeds
+    for output in outputs:
+        straight_energy_x, straight_time_x, optimizer_energy_x, optimizer_time_x, path_points, start_speed, end_speed, _ = output
 
         straight_energy.append(straight_energy_x)
         straight_time.append(straight_time_x)
@@ -67,8 +103,6 @@ def compare_tailwind_tests(z_c, wind_range):
         percentage_energy_savings.append(100 * (straight_energy_x - optimizer_energy_x) / straight_energy_x)
 
         paths.append(path_points)
-
-        print("-"*40)
     
     # Save to CSV
     with open("artifacts/reports/tailwind_test.csv", "w", newline="") as csvfile:
@@ -130,10 +164,10 @@ def compare_tailwind_tests(z_c, wind_range):
 
     return saved_energy_pcts, windspeeds, optimizer_energy, optimizer_time, straight_energy, straight_time
 
-def compare_headwind_tests(z_c, wind_range):
+def compare_headwind_tests(z_c, wind_range, outputs=None):
     """Compare PathOptimizer vs StraightLineMission across different windspeeds"""
     
-    windspeeds = wind_range
+    windspeeds = list(wind_range)
 
     #path points storage
     paths = []
@@ -150,13 +184,11 @@ def compare_headwind_tests(z_c, wind_range):
     print("Running tests...")
     print("="*60)
     
-    for windspeed in windspeeds:
-        print(f"\nTesting windspeed: {windspeed} m/s")
+    if outputs is None:
+        outputs = run_windspeeds(z_c, 180, windspeeds)  # headwind
 
-        # Set wind baseline
-        wind_field = Wind(z_c, 180, windspeed)  # tailwind
-        
-        straight_energy_x, straight_time_x, optimizer_energy_x, optimizer_time_x, path_points, start_speed, end_speed = simple_test(wind_field=wind_field)
+    for output in outputs:
+        straight_energy_x, straight_time_x, optimizer_energy_x, optimizer_time_x, path_points, start_speed, end_speed, _ = output
 
         straight_energy.append(straight_energy_x)
         straight_time.append(straight_time_x)
@@ -167,8 +199,6 @@ def compare_headwind_tests(z_c, wind_range):
         percentage_energy_savings.append(100 * (straight_energy_x - optimizer_energy_x) / straight_energy_x)
 
         paths.append(path_points)
-
-        print("-"*40)
     
     # Save to CSV
     with open("artifacts/reports/headwind_test.csv", "w", newline="") as csvfile:
@@ -228,11 +258,8 @@ def compare_headwind_tests(z_c, wind_range):
 
     return saved_energy_pcts, windspeeds, optimizer_energy, optimizer_time, straight_energy, straight_time
 
-def simple_test(wind_field=None):
-
-    wind_field = wind_field if wind_field is not None else Wind()
-
-    d1 = PathOptimizer(
+def build_optimizer(wind_field):
+    return PathOptimizer(
         rho=1.225,  # kg/m^3
         S=0.02,  # m^2
         CD0=1.1,  # drag coefficient
@@ -245,7 +272,18 @@ def simple_test(wind_field=None):
         wind_field=wind_field # pass in wind field
     )
 
-    result, total_time, total_E_Wh, path_points = d1.optimize_mission()
+def simple_test(wind_field=None, x0=None, optimizer=None):
+
+    wind_field = wind_field if wind_field is not None else DEFAULT_WIND
+
+    # reuse an existing optimizer when given, only the wind changes between runs
+    if optimizer is None:
+        d1 = build_optimizer(wind_field)
+    else:
+        d1 = optimizer
+        d1.set_wind(wind_field)
+
+    result, total_time, total_E_Wh, path_points = d1.optimize_mission(x0=x0)
 
     print("\n--- Optimization Results ---")
     print("Total Time (s):", total_time)
@@ -271,14 +309,16 @@ def simple_test(wind_field=None):
     print(f"Energy Saved by Optimization (Wh): {straight_E_Wh - total_E_Wh:.2f}")
     print(f"Percentage Energy Savings: {((straight_E_Wh - total_E_Wh) / straight_E_Wh * 100):.2f}%")
 
-    return straight_E_Wh, straight_time, total_E_Wh, total_time, path_points, result.x[0], result.x[1]
+    return straight_E_Wh, straight_time, total_E_Wh, total_time, path_points, result.x[0], result.x[1], result.x
 
 def test_energy():
     # comparing energy and time at different wind speeds in both headwind and tailwind
     z_c = 200
     wind_range = range(0, 31, 5)
-    savings_head, head_winds, head_opt_e, head_opt_t, head_str_e, head_str_t = compare_headwind_tests(z_c, wind_range)
-    savings_tail, tail_winds, tail_opt_e, tail_opt_t, tail_str_e, tail_str_t = compare_tailwind_tests(z_c, wind_range)
+    # headwind and tailwind sweeps run side by side
+    head_outputs, tail_outputs = sweep_directions(z_c, [180, 0], list(wind_range))
+    savings_head, head_winds, head_opt_e, head_opt_t, head_str_e, head_str_t = compare_headwind_tests(z_c, wind_range, head_outputs)
+    savings_tail, tail_winds, tail_opt_e, tail_opt_t, tail_str_e, tail_str_t = compare_tailwind_tests(z_c, wind_range, tail_outputs)
 
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
 
@@ -321,4 +361,5 @@ points = [
 def main():
     test_energy()
 
-main()
+if __name__ == '__main__':  # worker processes re-import this module
+    main()
@@ -0,0 +1,87 @@
+import sys
+from pathlib import Path
+
+# Add parent directory to path to allow importing from src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import math
+
+from src.optimizer_package.path_optimizer import PathOptimizer
+from tests.wind import Wind
+
+def reference_path(d, x):
+    """
+    The original scalar segment loop and power model, kept here as the reference the
+    vectorized / compiled compute_path has to reproduce
+    Returns:
+    E_total_J, time_total, max_power
+    """
+    v_start, v_end = x[0], x[1]
+    P0, P1, P2, P3 = d.start_point, (x[2], x[3], x[4]), (x[5], x[6], x[7]), d.end_point
+
+    # cubic Bezier, one point at a time
+    N = d.num_points
+    path_points = []
+    for k in range(N):
+        s = k / (N - 1)
+        b = ((1 - s)**3, 3 * s * (1 - s)**2, 3 * s**2 * (1 - s), s**3)
+        path_points.append(tuple(b[0] * P0[j] + b[1] * P1[j] + b[2] * P2[j] + b[3] * P3[j] for j in range(3)))
+
+    W = d.mass * d.g
+    E_total_J, time_total, max_power = 0.0, 0.0, 0.0
+    for i in range(N - 1):
+        p0, p1 = path_points[i], path_points[i + 1]
+
+        dist = math.sqrt((p1[0] - p0[0])**2 + (p1[1] - p0[1])**2 + (p1[2] - p0[2])**2)
+        s = i / max(N - 2, 1)
+        speed_local = max(1e-3, v_start + (v_end - v_start) * s)
+        dt = dist / speed_local
+        v_x, v_y, v_z = ((p1[j] - p0[j]) / dt for j in range(3))
+
+        v_wind = d.wind_field.get_wind_at_point(p0)
+        v_air_x, v_air_y, v_air_z = v_x - v_wind[0], v_y - v_wind[1], v_z - v_wind[2]
+        v_h = math.sqrt(v_air_x**2 + v_air_y**2)
+
+        D = 0.5 * d.rho * v_h**2 * d.CD0 * d.S
+        T = math.sqrt(W**2 + D**2)
+        v_i = math.sqrt(T / (2 * d.rho * d.area_rotors))
+        mu = v_h / (v_i + 1e-6)
+        P_induced = T * v_i / math.sqrt(1 + mu**2)
+        P_profile = 0.15 * W * v_i
+        P_parasitic = D * v_h
+        P_climb = W * v_air_z if v_air_z > 0 else 0
+        P_mechanical = (P_induced + P_profile + P_parasitic + P_climb) / d.figure_of_merit
+        power = max(P_mechanical / d.motor_efficiency, 0)
+
+        max_power = max(max_power, power)
+        E_total_J += power * dt
+        time_total += dt
+
+    return E_total_J, time_total, max_power
+
+def test_kernel_matches_reference():
+    d = PathOptimizer(
+        rho=1.225, S=0.02, CD0=1.1, mass=1.6, battery_capacity_Wh=200, motor_power_limit_W=1500,
+        start_point=(0, 0, 0), end_point=(1000, 0, 200), max_time=1000, wind_field=Wind(200, 45, 20)
+    )
+
+    # climbing, descending and looping control points, constant and varying speeds
+    cases = [
+        [15.0, 15.0, 333.3, 0.0, 220.0, 666.7, 0.0, 220.0],
+        [30.0, 15.0, 200.0, 40.0, 10.0, 800.0, -40.0, 240.0],
+        [18.5, 27.0, 900.0, -30.0, 150.0, 100.0, 30.0, 60.0],
+    ]
+    for x in cases:
+        E_total_J, time_total, _ = d.compute_path(x)
+        E_ref, time_ref, max_power_ref = reference_path(d, x)
+
+        assert math.isclose(E_total_J, E_ref, rel_tol=1e-9), (x, E_total_J, E_ref)
+        assert math.isclose(time_total, time_ref, rel_tol=1e-9), (x, time_total, time_ref)
+        assert math.isclose(d.max_power_encountered, max_power_ref, rel_tol=1e-9), (x, d.max_power_encountered, max_power_ref)
+
+def main():
+    test_kernel_matches_reference()
+    print("compute_path matches the scalar reference")
+
+if __name__ == '__main__':
+    main()
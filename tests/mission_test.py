@@ -9,6 +9,8 @@ import matplotlib.pyplot as plt
 from src.optimizer_package.path_optimizer import PathOptimizer
 from tests.wind import Wind
 
+Path('artifacts/plots').mkdir(parents=True, exist_ok=True)
+
 def test_mission(points, wind):
     print("-"*60)
     mission_path_points = []
@@ -21,6 +23,7 @@ def test_mission(points, wind):
 
     dir_wind = wind.get_wind_direction()
     max_wind_alt = wind.get_max_wind_alt()
+    wind_vec = wind.get_display_wind_at_point((0, 0, max_wind_alt))
 
     # Labels
     ax.set_xlabel("X (m)")
@@ -29,34 +32,35 @@ def test_mission(points, wind):
     ax.set_title("3D Drone Flight Path")
 
     ax.quiver(
-        points[0][0], points[0][1], wind.get_max_wind_alt(),
+        points[0][0], points[0][1], max_wind_alt,
         dir_wind[0], dir_wind[1], dir_wind[2],
-        length=100, color='red', normalize=True, label=('Wind: ' + str(wind.get_wind_at_point((0, 0, max_wind_alt))) + " at: " + str(max_wind_alt) + "m")
+        length=100, color='red', normalize=True, label=('Wind: ' + str(wind_vec) + " at: " + str(max_wind_alt) + "m")
+    )
+
+    d1 = PathOptimizer(
+        rho=1.225,  # kg/m^3
+        S=0.02,  # m^2
+        CD0=1.1,  # drag coefficient
+        mass=1.6,  # kg
+        battery_capacity_Wh=200,  # Wh
+        motor_power_limit_W=1500,  # W
+        start_point=points[0],
+        end_point=points[-1],
+        max_time=1000 * (len(points) - 1), # seconds, for the whole mission
+        wind_field=wind # pass in wind field
     )
 
+    # One optimization over all segments, minimizing the energy of the whole mission
+    result, segment_times, segment_energies, segment_paths = d1.optimize_multi_segment(points)
+
     for i in range(len(points)-1):
         start = points[i]
         end = points[i+1]
-
-        d1 = PathOptimizer(
-            rho=1.225,  # kg/m^3
-            S=0.02,  # m^2
-            CD0=1.1,  # drag coefficient
-            mass=1.6,  # kg
-            battery_capacity_Wh=200,  # Wh
-            motor_power_limit_W=1500,  # W
-            start_point=start,
-            end_point=end,
-            max_time=1000, # seconds
-            wind_field=wind # pass in wind field
-        )
-
-        result, time, E_Wh, path_points = d1.optimize_mission()
+        x = result.x[8 * i:8 * (i + 1)]  # this segment's variables
+        time, E_Wh, path_points = segment_times[i], segment_energies[i], segment_paths[i]
 
         # plot segment
-        xs = [p[0] for p in path_points]
-        ys = [p[1] for p in path_points]
-        zs = [p[2] for p in path_points]
+        xs, ys, zs = path_points[:, 0], path_points[:, 1], path_points[:, 2]  # (N, 3) ndarray columns
 
         ax.plot(xs, ys, zs, marker='o', color='blue', label='_Flight Path')
 
@@ -74,12 +78,12 @@ def test_mission(points, wind):
         
         # Create straight line control points (start and end only)
         straight_line_x = [
-            result.x[0], result.x[1],  # Use same speeds as optimized path
+            x[0], x[1],  # Use same speeds as optimized path
             start[0], start[1], start[2],  # Start point
             end[0], end[1], end[2]  # End point
         ]
         
-        straight_E_J, straight_time, straight_path = d1.compute_path(straight_line_x)
+        straight_E_J, straight_time, _, straight_path = d1.evaluate_path(straight_line_x, start, end)
         straight_E_Wh = straight_E_J / 3600
         straight_line_energy_for_segments.append(straight_E_Wh)
 
@@ -88,8 +92,8 @@ def test_mission(points, wind):
         print("Time (s):", time)
         print("Energy (Wh):", E_Wh)
         print(f"Straight Line Energy (Wh): {straight_E_Wh:.2f}")
-        print(f"Start speed (m/s): ", result.x[0])  # print speeds
-        print(f"End speed (m/s): ", result.x[1])  # print
+        print(f"Start speed (m/s): ", x[0])  # print speeds
+        print(f"End speed (m/s): ", x[1])  # print
         print("")
 
     mission_path_points.append(points[-1])  # add final point
@@ -107,7 +111,8 @@ def test_mission(points, wind):
     ax.legend()
     plt.tight_layout()
     plt.savefig('artifacts/plots/flight_path.png', dpi=300, bbox_inches='tight', pad_inches=0.5)
-    plt.show()
+    if sys.stdout.isatty():  # a headless run would block on the window
+        plt.show()
     
 # Define mission points with multiple waypoints
 mission_points = [
@@ -4,11 +4,16 @@ from pathlib import Path
 # Add parent directory to path to allow importing from src
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import matplotlib
+if not sys.stdout.isatty():  # headless batch run, figures are only saved
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import math
+import numpy as np
 
 from src.optimizer_package.path_optimizer import PathOptimizer
-from tests.wind import Wind
+from tests.wind import Wind, DEFAULT_WIND
+
+Path('artifacts/plots').mkdir(parents=True, exist_ok=True)
 
 # simple path points for testing
 points = [
@@ -18,14 +23,19 @@ points = [
 
 
 def get_distance(p1, p2):
-    return math.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2 + (p2[2] - p1[2])**2)
+    # works on tuples and on (3,) or (N, 3) ndarrays (distance per row)
+    d = np.asarray(p2, dtype=np.float64) - np.asarray(p1, dtype=np.float64)
+    return np.sqrt(np.einsum('...i,...i->...', d, d))
+
+def total_distance(path_arr):
+    # length of an (N, 3) path, all segments at once
+    d = path_arr[1:] - path_arr[:-1]
+    return np.sqrt(np.einsum('ij,ij->i', d, d)).sum()
 
 def plot_flight_path(path_points, wind_field_obj=None):
     # Plotting the 3D flight path
-    all_points = path_points
-    xs = [p[0] for p in all_points]
-    ys = [p[1] for p in all_points]
-    zs = [p[2] for p in all_points]
+    all_points = np.asarray(path_points, dtype=np.float64)  # (N, 3)
+    xs, ys, zs = all_points[:, 0], all_points[:, 1], all_points[:, 2]
 
     fig = plt.figure(figsize=(8, 6))
     ax = fig.add_subplot(111, projection='3d')
@@ -35,19 +45,21 @@ def plot_flight_path(path_points, wind_field_obj=None):
     if wind_field_obj is not None:
         wind_field = wind_field_obj
     else:
-        wind_field = Wind()
+        wind_field = DEFAULT_WIND
 
     dir_wind = wind_field.get_wind_direction()
     max_wind_alt = wind_field.get_max_wind_alt()
+    wind_vec = wind_field.get_display_wind_at_point((0, 0, max_wind_alt))
 
     ax.quiver(
-        all_points[0][0], all_points[0][1], wind_field.get_max_wind_alt(),
+        all_points[0, 0], all_points[0, 1], max_wind_alt,
         dir_wind[0], dir_wind[1], dir_wind[2],
-        length=100, color='red', normalize=True, label=('Wind: ' + str(wind_field.get_wind_at_point((0, 0, max_wind_alt))) + " at: " + str(max_wind_alt) + "m")
+        length=100, color='red', normalize=True, label=('Wind: ' + str(wind_vec) + " at: " + str(max_wind_alt) + "m")
     )
 
     # Straight line from start to end
-    ax.plot([xs[0], xs[-1]], [ys[0], ys[-1]], [zs[0], zs[-1]], marker='o', color='green', markersize=10, label='Straight Line Path')
+    ends = all_points[[0, -1]]
+    ax.plot(ends[:, 0], ends[:, 1], ends[:, 2], marker='o', color='green', markersize=10, label='Straight Line Path')
 
     # Highlight start and end
     ax.scatter(*all_points[0], color='green', s=100, label='Start')
@@ -60,12 +72,14 @@ def plot_flight_path(path_points, wind_field_obj=None):
     ax.set_title("3D Drone Flight Path")
     ax.legend()
 
-    plt.savefig('artifacts/plots/flight_path.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    plt.savefig('artifacts/plots/flight_path.png', dpi=100)
+    if sys.stdout.isatty():
+        plt.show()
+    plt.close(fig)
 
 def simple_test(wind_field=None, plot=False):
 
-    wind_field = wind_field if wind_field is not None else Wind()
+    wind_field = wind_field if wind_field is not None else DEFAULT_WIND
 
     d1 = PathOptimizer(
         rho=1.225,  # kg/m^3
@@ -81,12 +95,14 @@ def simple_test(wind_field=None, plot=False):
     )
 
     result, total_time, total_E_Wh, path_points = d1.optimize_mission()
+    path_points = np.asarray(path_points, dtype=np.float64)
 
     print("\n--- Optimization Results ---")
     print("Total Time (s):", total_time)
     print("Total Energy (Wh):", total_E_Wh)
     print("start speed (m/s): ", result.x[0])  # print speeds
     print("end speed (m/s): ", result.x[1])  # print speeds
+    print(f"Path Length (m): {total_distance(path_points):.2f}")
 
     # Calculate straight-line energy consumption
     print("\n--- Straight Line Comparison ---")
@@ -103,6 +119,7 @@ def simple_test(wind_field=None, plot=False):
     
     print(f"Straight Line Energy (Wh): {straight_E_Wh:.2f}")
     print(f"Straight Line Time (s): {straight_time:.2f}")
+    print(f"Straight Line Length (m): {get_distance(points[0], points[-1]):.2f}")
     print(f"Energy Saved by Optimization (Wh): {straight_E_Wh - total_E_Wh:.2f}")
     print(f"Percentage Energy Savings: {((straight_E_Wh - total_E_Wh) / straight_E_Wh * 100):.2f}%")
 
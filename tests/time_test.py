@@ -4,79 +4,74 @@ from pathlib import Path
 # Add parent directory to path to allow importing from src
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import os
 import numpy as np
+import matplotlib
+if not sys.stdout.isatty():
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-from tests.wind import Wind
+from tests.wind import make_wind
 from src.optimizer_package.path_optimizer import PathOptimizer
 
-def time_test(tests=48): 
+Path('artifacts/plots').mkdir(parents=True, exist_ok=True)
+
+def time_test(tests=48, plot=False): 
     points = [
         (0, 0, 0),      # Start point
         (1000, 0, 200), # End point
     ]
 
-    start_times = []
-    end_times = []
-    run_times = []
+    run_times = [None] * tests
     
     wind_speeds = [0, 5, 10, 15, 20, 25]
     wind_directions = [0, 45, 90, 135, 180, 225, 270, 315]
     
     # Store results for analysis
-    results = []
+    results = [None] * tests
 
     print(f"\n{'='*70}")
     print(f"RUNNING {tests} OPTIMIZATION TESTS")
     print(f"Testing {len(wind_speeds)} wind speeds × {len(wind_directions)} directions")
     print(f"{'='*70}\n")
 
-    for i in range(tests):
-        #cycle through combinations
-        wind_idx = i % len(wind_speeds)
-        dir_idx = (i // len(wind_speeds)) % len(wind_directions)
-        
-        wind_speed = wind_speeds[wind_idx]
-        wind_dir = wind_directions[dir_idx]
-        
-        print(f"\n--- Test {i+1}/{tests}: Wind {wind_speed} m/s @ {wind_dir}° ---")
-        
-        # Create wind field
-        wind_field = Wind(
-            z_c=10,
-            direction=wind_dir,
-            reference_wind=wind_speed,
-        )
-        
-        # Run optimization
-        start_time = time.time()
-        result = run_mission(wind_field, points)
-        end_time = time.time()
-        
-        runtime = end_time - start_time
-        
-        start_times.append(start_time)
-        end_times.append(end_time)
-        run_times.append(runtime)
-        
-        # Store results
-        results.append({
-            'test_num': i + 1,
-            'wind_speed': wind_speed,
-            'wind_direction': wind_dir,
-            'runtime': runtime,
-            'success': result is not None
-        })
-        
-        print(f"Optimization took {runtime:.2f} seconds")
-        
-        # Progress indicator
-        if (i + 1) % 8 == 0:  # After each full direction sweep
-            print(f"\n{'='*70}")
-            print(f"Completed {i+1}/{tests} tests ({(i+1)/tests*100:.1f}%)")
-            print(f"Average time: {np.mean(run_times):.2f} s")
-            print(f"{'='*70}")
+    # Tests of one wind direction (consecutive i, wind speed varying fastest) form a block that
+    # runs in order and warm starts from the previous solution. Blocks are spread over one worker
+    # process per core, each worker times its own runs
+    blocks = [range(start, min(start + len(wind_speeds), tests)) for start in range(0, tests, len(wind_speeds))]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        futures = [ex.submit(run_cases, block, wind_speeds, wind_directions, points) for block in blocks]
+        block_results = (case for future in as_completed(futures) for case in future.result())
+
+        log = []  # per test lines, flushed at every progress checkpoint
+        for completed, (i, runtime, success, nit) in enumerate(block_results, start=1):
+            wind_speed, wind_dir = case_wind(i, wind_speeds, wind_directions)
+
+            run_times[i] = runtime
+            
+            # Store results
+            results[i] = {
+                'test_num': i + 1,
+                'wind_speed': wind_speed,
+                'wind_direction': wind_dir,
+                'runtime': runtime,
+                'success': success,
+                'iterations': nit  # None for failed runs
+            }
+            
+            log.append(f"\n--- Test {i+1}/{tests}: Wind {wind_speed} m/s @ {wind_dir}° ---")
+            log.append(f"Optimization took {runtime:.2f} seconds ({nit} iterations)")
+            
+            # Progress indicator, the buffered test lines are printed at once
+            if completed % 8 == 0 or completed == tests:  # After every 8 completed tests
+                log.append(f"\n{'='*70}")
+                log.append(f"Completed {completed}/{tests} tests ({completed/tests*100:.1f}%)")
+                log.append(f"Average time: {np.mean([t for t in run_times if t is not None]):.2f} s")
+                log.append(f"{'='*70}")
+                print("\n".join(log))
+                log = []
 
     # Final statistics
     print(f"\n{'='*70}")
@@ -91,12 +86,45 @@ def time_test(tests=48):
     print(f"Max time:        {max(run_times):.2f} s")
     print(f"{'='*70}\n")
     
-    # Plot results
-    plot_run_times(run_times, results, wind_speeds, wind_directions)
+    # Plot results, off by default for pure timing runs
+    if plot:
+        plot_run_times(run_times, results, wind_speeds, wind_directions)
     
     return results
 
-def run_mission(wind_field, points):
+def case_wind(i, wind_speeds, wind_directions):
+    # cycle through combinations
+    wind_speed = wind_speeds[i % len(wind_speeds)]
+    wind_dir = wind_directions[(i // len(wind_speeds)) % len(wind_directions)]
+    return wind_speed, wind_dir
+
+def run_cases(cases, wind_speeds, wind_directions, points):
+    """Run tests in order, each warm started from the last successful solution, returns [(i, runtime, success, nit)]"""
+    prev_x = None
+    results = []
+    for i in cases:
+        i, runtime, success, nit, x = run_case(i, wind_speeds, wind_directions, points, x0=prev_x)
+        prev_x = x if success else prev_x
+        results.append((i, runtime, success, nit))
+    return results
+
+def run_case(i, wind_speeds, wind_directions, points, x0=None):
+    """Run test i, optionally warm started from x0, returns (i, runtime, success, result.nit, result.x)"""
+    wind_speed, wind_dir = case_wind(i, wind_speeds, wind_directions)
+
+    # Create wind field
+    wind_field = make_wind(10, wind_dir, wind_speed)
+
+    # Run optimization
+    start_time = time.perf_counter()
+    result = run_mission(wind_field, points, x0=x0, tol=1e-4, maxiter=100)
+    end_time = time.perf_counter()
+
+    if result is None:
+        return i, end_time - start_time, False, None, None
+    return i, end_time - start_time, True, result.nit, result.x
+
+def run_mission(wind_field, points, x0=None, method='SLSQP', tol=1e-4, maxiter=200):
     """Run a single mission optimization"""
     d1 = PathOptimizer(
         rho=1.225,                  # kg/m^3
@@ -112,7 +140,7 @@ def run_mission(wind_field, points):
         VERBOSE=False               # Don't print details for batch runs
     )
 
-    result, time_taken, energy, path = d1.optimize_mission()
+    result, time_taken, energy, path = d1.optimize_mission(x0=x0, method=method, tol=tol, maxiter=maxiter)
     
     return result 
     
@@ -120,6 +148,11 @@ def plot_run_times(run_times, results, wind_speeds, wind_directions):
     """Create visualization of run times"""
     
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+
+    # Per test wind speed / direction indices, averages per group come from one bincount each
+    runtimes = np.asarray(run_times)
+    speed_idx = np.array([wind_speeds.index(r['wind_speed']) for r in results])
+    dir_idx = np.array([wind_directions.index(r['wind_direction']) for r in results])
     
     # Run times over all tests
     ax1 = axes[0, 0]
@@ -134,11 +167,8 @@ def plot_run_times(run_times, results, wind_speeds, wind_directions):
     
     # Run times by wind speed
     ax2 = axes[0, 1]
-    wind_speed_times = {ws: [] for ws in wind_speeds}
-    for r in results:
-        wind_speed_times[r['wind_speed']].append(r['runtime'])
-    
-    avg_times_by_speed = [np.mean(wind_speed_times[ws]) for ws in wind_speeds]
+    avg_times_by_speed = (np.bincount(speed_idx, runtimes, minlength=len(wind_speeds))
+                          / np.maximum(np.bincount(speed_idx, minlength=len(wind_speeds)), 1))
     ax2.bar(range(len(wind_speeds)), avg_times_by_speed, 
             tick_label=[f"{ws} m/s" for ws in wind_speeds])
     ax2.set_title('Average Run Time by Wind Speed', fontsize=12, fontweight='bold')
@@ -148,11 +178,8 @@ def plot_run_times(run_times, results, wind_speeds, wind_directions):
     
     # Run times by direction
     ax3 = axes[1, 0]
-    direction_times = {d: [] for d in wind_directions}
-    for r in results:
-        direction_times[r['wind_direction']].append(r['runtime'])
-    
-    avg_times_by_dir = [np.mean(direction_times[d]) for d in wind_directions]
+    avg_times_by_dir = (np.bincount(dir_idx, runtimes, minlength=len(wind_directions))
+                        / np.maximum(np.bincount(dir_idx, minlength=len(wind_directions)), 1))
     ax3.bar(range(len(wind_directions)), avg_times_by_dir,
             tick_label=[f"{d}°" for d in wind_directions])
     ax3.set_title('Average Run Time by Wind Direction', fontsize=12, fontweight='bold')
@@ -174,14 +201,15 @@ def plot_run_times(run_times, results, wind_speeds, wind_directions):
     ax4.grid(True, alpha=0.3, axis='y')
     
     plt.tight_layout()
-    plt.savefig('artifacts/plots/optimization_performance.png', dpi=300, bbox_inches='tight')
+    plt.savefig('artifacts/plots/optimization_performance.png', dpi=100)
     print("Performance plot saved to: optimization_performance.png")
-    plt.show()
+    plt.close(fig)
 
 
 def main():
     # Test all combinations: 6 speeds × 8 directions = 48 tests
-    results = time_test(tests=48)
+    results = time_test(tests=48, plot=True)
     
 
-main()
\ No newline at end of file
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -1,69 +1,148 @@
+import functools
 import math
+import numpy as np
 import matplotlib.pyplot as plt
 
+from src.optimizer_package.path_optimizer import njit  # no-op decorator when numba is missing
+
+
+@njit(cache=True, fastmath=True)
+def wind_at(z, reference_wind, inv_zc, cx, cy):
+    """
+    Power law wind profile, z is one altitude or an array of altitudes
+    Returns:
+    vx, vy: wind components along x and y
+    """
+    mag = reference_wind * (z * inv_zc)**0.2
+    return mag * cx, mag * cy
+
+
+def snap_small(vec, eps=1e-3):
+    # zero components below eps, hides trig round off (e.g. cos(90°) ~ 6e-17) in displayed vectors
+    return tuple(0.0 if abs(c) < eps else c for c in vec)
+
+
 class Wind:
+    # Fixed attribute set, no per instance __dict__
+    __slots__ = ('z_c', 'direction', 'reference_wind', '_deg2rad', '_rad', '_cx', '_cy', '_inv_zc',
+                 '_direction_vec', '_frozen')
+
     def __init__(self, z_c=200, direction=0, reference_wind=20):
-        self.z_c = z_c  # altitude of reference wind speed in meters
-        self.direction = direction
-        self.reference_wind = reference_wind  # m/s
+        # Stored as floats (the typed double members of a compiled class), so int and float
+        # arguments give the jitted wind_at kernel the same signature
+        self.z_c = float(z_c)  # altitude of reference wind speed in meters
+        self.direction = float(direction)
+        self.reference_wind = float(reference_wind)  # m/s
+
+        # Trig and scale constants, so no lookup recomputes them
+        self._deg2rad = math.pi / 180
+        self._rad = direction * self._deg2rad  # deg to radians
+        self._cx = math.cos(self._rad)
+        self._cy = math.sin(self._rad)
+        self._inv_zc = 1.0 / z_c
+
+        # Unit wind direction, fixed for the lifetime of the (immutable) wind field
+        self._direction_vec = self._compute_direction()
+
+        # Wind fields are immutable once built, so they can be hashed and shared (see make_wind)
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_frozen', False):
+            raise AttributeError("Wind is immutable, build a new one with make_wind")
+        object.__setattr__(self, name, value)
+
+    def __reduce__(self):
+        # rebuild through __init__ on unpickling, restoring slots one by one would trip __setattr__
+        return (Wind, self._key())
+
+    def _key(self):
+        return (self.z_c, self.direction, self.reference_wind)
+
+    def __eq__(self, other):
+        return isinstance(other, Wind) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
 
     def get_wind_at_point(self, position):
         """
         updatess wind vector (vx, vy, vz) at given position (x, y, z)
         Wind speed varies with altitude.
         """
-        x, y, z = position
+        vx, vy = wind_at(float(position[2]), self.reference_wind, self._inv_zc, self._cx, self._cy)
+        return (vx, vy, 0.0)  # assume no vertical wind for now
 
-        mag = self.reference_wind * (z / self.z_c)**(0.2)  # power law wind profile
+    def get_wind_at_points(self, positions):
+        """
+        Batch version of get_wind_at_point for an (N, 3) array of positions
+        Returns an (N, 3) array of wind vectors.
+        """
+        positions = np.asarray(positions, dtype=float)
 
-        vx = mag * math.cos(self.direction * (math.pi/180)) # wind magnitude in x-direction (converts deg to radians)
-        vy = mag * math.sin(self.direction * (math.pi/180)) # y direction
-        
-        if vy < 0.001 and vy > -0.001:
-            vy = 0.0
-        if vx < 0.001 and vx > -0.001:
-            vx = 0.0
+        vx, vy = wind_at(positions[:, 2], self.reference_wind, self._inv_zc, self._cx, self._cy)
 
-        return (vx, vy, 0.0)  # assume no vertical wind for now
+        wind = np.zeros_like(positions)
+        wind[:, 0] = vx
+        wind[:, 1] = vy
+        return wind  # assume no vertical wind for now
+
+    def get_display_wind_at_point(self, position):
+        # get_wind_at_point for labels and printouts, sub mm/s components shown as 0.0
+        return snap_small(self.get_wind_at_point(position))
     
     def get_wind_direction(self):
+        return self._direction_vec
+
+    def _compute_direction(self):
         vx, vy, vz = self.get_wind_at_point((0, 0, self.z_c))
         mag = (vx**2 + vy**2 + vz**2)**0.5
         if mag == 0:
             return (0, 0, 0)
         #print("Wind Direction: " + str((vx/mag, vy/mag, vz/mag)))
-        return (vx/mag, vy/mag, vz/mag)
+        return snap_small((vx/mag, vy/mag, vz/mag))
     
     def get_max_wind_alt(self):
         return self.z_c
     
     def set_baseline_wind(self, new_baseline):
-        self.baseline_wind = new_baseline
+        # Wind is immutable, returns the wind field with the new reference wind speed
+        return make_wind(self.z_c, self.direction, new_baseline)
+
+    def print_map(self, plot=True):
+        # Wind speed at every altitude 0..300 m in one expression, (cos, sin) is a unit vector
+        # so the speed is the power law magnitude itself
+        altitudes = np.arange(0, 301)
+        speeds = abs(self.reference_wind) * np.power(altitudes * self._inv_zc, 0.2)
 
-    def print_map(self):
         # Print wind speed at various altitudes
-        print("Altitude (m) | Wind Speed (m/s)")
-        for z in range(0, 301, 10):
-            vx, vy, vz = self.get_wind_at_point((0, 0, z))
-            speed = (vx**2 + vy**2 + vz**2)**0.5
-            print(f"{z:12} | {speed:15.2f}")
+        print("Altitude (m) | Wind Speed (m/s)\n" + "\n".join(
+            f"{z:12d} | {speed:15.2f}" for z, speed in zip(altitudes[::10], speeds[::10])))
+
+        if not plot:
+            return
 
         # showing plot of wind speed vs altitude
-        altitudes = list(range(0, 301, 1))
-        speeds = [] 
-        for z in altitudes:
-            vx, vy, vz = self.get_wind_at_point((0, 0, z))
-            speed = (vx**2 + vy**2 + vz**2)**0.5
-            speeds.append(speed)
-        plt.plot(altitudes, speeds, linewidth=2)
-        plt.ylabel('Wind Speed (m/s)')
-        plt.xlabel('Altitude (m)')
-        plt.title('Wind Speed vs Altitude', fontsize=14, fontweight='bold')
-        plt.grid()
-        plt.savefig('artifacts/plots/wind_speed_vs_altitude.png')
-        #plt.show()
+        fig, ax = plt.subplots()
+        ax.plot(altitudes, speeds, linewidth=2)
+        ax.set_ylabel('Wind Speed (m/s)')
+        ax.set_xlabel('Altitude (m)')
+        ax.set_title('Wind Speed vs Altitude', fontsize=14, fontweight='bold')
+        ax.grid()
+        fig.savefig('artifacts/plots/wind_speed_vs_altitude.png')
+        plt.close(fig)  # free the figure, print_map may be called many times
         
 
+@functools.lru_cache(maxsize=64)
+def make_wind(z_c=200, direction=0, reference_wind=20):
+    # Shared Wind per (z_c, direction, reference_wind), repeated sweeps reuse the same objects
+    return Wind(z_c, direction, reference_wind)
+
+
+# Shared default wind field, for callers that are not given one
+DEFAULT_WIND = make_wind()
+
+
 """
 # test wind field
 def main():